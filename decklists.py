@@ -16,8 +16,12 @@ Features
     1 Forest
 - Batches lookups using the /cards/collection endpoint (75 identifiers per request).
 - Handles double-faced cards and downloads each face.
+- Downloads images concurrently (--workers, default 8); --http2 multiplexes them over one connection.
 - Selectable image size: png|large|normal|small|art_crop|border_crop (default: png).
 - Optional per-set subfolders, quantity-aware filenames, and overwrite behavior.
+- Caches resolved cards in ~/.cache/mtg-downloader/cards.json (or $XDG_CACHE_HOME), so re-runs
+  only query Scryfall for new identifiers and skip cards already on disk. Use --refresh-cache
+  (or --overwrite) to re-query every identifier, e.g. to pick up the current printing for name-only lines.
 
 Usage examples
 --------------
@@ -47,72 +51,131 @@ Requirements
 ------------
 - Python 3.8+
 - pip install requests tqdm
+- Optional: pip install orjson (faster decoding of Scryfall responses and the card cache)
+- Optional: pip install "httpx[http2]" (for --http2)
 
 Notes
 -----
 - Scryfall API docs: https://scryfall.com/docs/api
-- This script respects Scryfall's recommended batching. Please avoid excessive parallelism.
+- This script respects Scryfall's recommended batching and caps concurrent image downloads.
+  Please avoid excessive parallelism.
 """
 
 import argparse
+import email.utils
+import functools
+import hashlib
+import itertools
+import json
 import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
+try:
+    import orjson  # optional, faster JSON decoding
+except ImportError:
+    orjson = None
+
+try:
+    import httpx  # optional, enables --http2
+except ImportError:
+    httpx = None
+
+USER_AGENT = "scryfall-downloader/1.2 (+https://scryfall.com/docs/api)"
 SCRYFALL_COLLECTION_URL = "https://api.scryfall.com/cards/collection"
 BATCH_SIZE = 75
+DEFAULT_WORKERS = 8
+PROGRESS_BATCH = 16
+HTTP_RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRY_AFTER = 60.0
+# Card images are already compressed; don't ask the CDN to gzip them again
+IMAGE_HEADERS = {"Accept-Encoding": "identity"}
+STREAM_THRESHOLD = 8 * 1024 * 1024
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+CACHE_DIRNAME = "mtg-downloader"
+CACHE_FILENAME = "cards.json"
 VALID_SIZES = {"png", "large", "normal", "small", "art_crop", "border_crop"}
 
+# Comment lines and section headers in exported decklists
+_SKIP_PREFIXES = ("#", "//", "Sideboard", "Commander", "Companion", "Maybeboard")
+
+_RE_SANITIZE = re.compile(r"[^\w\s\-\(\)\[\]\.&,'!+]", re.UNICODE)
+_RE_FOIL = re.compile(r"\*F\*|\(Foil\)", re.IGNORECASE)
+# "[qty[x]] name [(set) [collector number] | collector number]" in a single match. The name is
+# greedy in each alternative, so the engine backtracks from the tail of the line instead of
+# retrying the optional groups after every character of a lazy name; ending the name on \S keeps
+# long whitespace runs from being rescanned at every position.
+_RE_LINE = re.compile(
+    r"^\s*(?:(?P<qty>\d+)\s*x?\s+)?(?:"
+    r"(?P<name_set>.*\S)\s*\((?P<set>[A-Za-z0-9]{2,5})\)(?:\s*(?P<cn_set>\d+[a-z]?))?"
+    r"|(?P<name_cn>.*\S)\s+(?P<cn>\d+[a-z]?)"
+    r"|(?P<name>.+)"
+    r")\s*$",
+    re.IGNORECASE,
+)
+# What's left as the "name" on lines with no card name: a bare quantity ("60", "4x") or set code ("(M10)")
+_RE_NOT_A_NAME = re.compile(r"\d+x?|\([A-Za-z0-9]{2,5}\)", re.IGNORECASE)
+_RE_DFC = re.compile(r"\s*//\s*")
+
 
 def dprint(debug: bool, *args):
     if debug:
         print("[DEBUG]", *args, file=sys.stderr)
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(name: str) -> str:
-    name = name.strip()
-    name = re.sub(r"[^\w\s\-\(\)\[\]\.&,'!+]", "", name, flags=re.UNICODE)
-    name = re.sub(r"\s+", " ", name)
-    return name
+    name = _RE_SANITIZE.sub("", name)
+    # split()/join() trims and collapses whitespace runs in one C-level pass
+    return " ".join(name.split())
 
 
 def parse_deck_line(line: str) -> Optional[Dict]:
     s = line.strip()
     if not s:
         return None
-    if s.startswith(("#", "//", "Sideboard", "Commander", "Companion", "Maybeboard")):
+    if s.startswith(_SKIP_PREFIXES):
         return None
-    s = re.sub(r"\*F\*|\(Foil\)", "", s, flags=re.IGNORECASE).strip()
-
-    m_qty = re.match(r"^(\d+)\s*x?\s+(.*)$", s, flags=re.IGNORECASE)
-    if m_qty:
-        qty = int(m_qty.group(1))
-        rest = m_qty.group(2).strip()
-    else:
-        qty = 1
-        rest = s
-
-    m_set = re.search(r"\(([A-Za-z0-9]{2,5})\)", rest)
-    set_code = m_set.group(1).lower() if m_set else None
-    if m_set:
-        rest_wo_set = (rest[:m_set.start()] + rest[m_set.end():]).strip()
-    else:
-        rest_wo_set = rest
+    # Substring checks are far cheaper than a regex pass and rule out most lines
+    lowered = s.lower()
+    if "*f*" in lowered or "(foil)" in lowered:
+        s = _RE_FOIL.sub("", s).strip()
 
-    m_num = re.search(r"\b(\d+[a-z]?)\b\s*$", rest_wo_set, flags=re.IGNORECASE)
-    if m_num:
-        collector_number = m_num.group(1)
-        name = rest_wo_set[: m_num.start()].strip()
+    m = _RE_LINE.fullmatch(s)
+    if not m:
+        return None
+    qty = int(m.group("qty")) if m.group("qty") else 1
+    if m.group("set"):
+        set_code = m.group("set").lower()
+        collector_number = m.group("cn_set")
+        name = m.group("name_set")
+    elif m.group("name_cn") is not None:
+        set_code = None
+        collector_number = m.group("cn")
+        name = m.group("name_cn")
     else:
+        set_code = None
         collector_number = None
-        name = rest_wo_set.strip()
+        name = m.group("name")
+    name = name.strip()
+    if _RE_NOT_A_NAME.fullmatch(name):
+        return None
 
-    name = re.sub(r"\s*//\s*", " // ", name)
+    if "//" in name:
+        name = _RE_DFC.sub(" // ", name)
     if not name:
         return None
 
@@ -140,21 +203,25 @@ def read_decklist_from_file(path: str) -> List[str]:
     return [line for line in txt.splitlines()]
 
 
-def build_identifiers(entries: List[Dict]) -> List[Dict]:
-    identifiers = []
+def build_identifiers(entries: Iterable[Dict]) -> Iterator[Dict]:
     for e in entries:
-        if e.get("set") and e.get("collector_number"):
-            identifiers.append({"set": e["set"], "collector_number": str(e["collector_number"])})
-        elif e.get("set"):
-            identifiers.append({"name": e["name"], "set": e["set"]})
+        set_code = e.get("set")
+        cn = e.get("collector_number")
+        if set_code and cn:
+            yield {"set": set_code, "collector_number": str(cn)}
+        elif set_code:
+            yield {"name": e["name"], "set": set_code}
         else:
-            identifiers.append({"name": e["name"]})
-    return identifiers
+            yield {"name": e["name"]}
 
 
-def chunked(iterable, size):
-    for i in range(0, len(iterable), size):
-        yield iterable[i : i + size]
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    it = iter(iterable)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield batch
 
 
 def pick_image_uris(card: Dict, size: str):
@@ -181,17 +248,121 @@ def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
 
-def download_file(session: requests.Session, url: str, dest: str, overwrite: bool = False, delay: float = 0.0):
-    if not overwrite and os.path.exists(dest):
+def make_session(pool_maxsize: int = 32) -> requests.Session:
+    # Keep-alive pool sized for the download workers; transient 429/5xx responses are retried by urllib3,
+    # including the /cards/collection POST (a read-only lookup, so safe to repeat)
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=sorted(RETRY_STATUSES),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+    )
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def retry_after_seconds(value: Optional[str], attempt: int) -> float:
+    # Retry-After is either delta-seconds or an HTTP date; fall back to exponential backoff
+    if value:
+        try:
+            return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(value)
+                return min(max(when.timestamp() - time.time(), 0.0), MAX_RETRY_AFTER)
+            except (TypeError, ValueError):
+                pass
+    return RETRY_BACKOFF * (2 ** attempt)
+
+
+def post_collection(session: "requests.Session | httpx.Client", payload: Dict, timeout: float):
+    # The requests session already retries this POST in urllib3, but httpx (--http2) only retries
+    # failed connects, so 429/5xx responses that reach us are retried here for both transports
+    for attempt in range(HTTP_RETRIES + 1):
+        resp = session.post(SCRYFALL_COLLECTION_URL, json=payload, timeout=timeout)
+        if resp.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+            break
+        time.sleep(retry_after_seconds(resp.headers.get("Retry-After"), attempt))
+    resp.raise_for_status()
+    return resp
+
+
+def make_http2_client(max_connections: int, timeout: float) -> "httpx.Client":
+    # One multiplexed HTTP/2 connection per host replaces a pool of HTTP/1.1 connections;
+    # httpx only retries failed connects; post_collection() covers 429/5xx on the collection POST
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    transport = httpx.HTTPTransport(http2=True, limits=limits, retries=HTTP_RETRIES)
+    return httpx.Client(http2=True, transport=transport, timeout=timeout, headers={"User-Agent": USER_AGENT})
+
+
+def make_throttle(interval: float, cancelled: threading.Event) -> Callable[[], bool]:
+    # Thread-safe wait() that spaces successive calls at least `interval` seconds apart,
+    # so --delay limits the download rate across all workers rather than per worker.
+    # Returns False (without waiting out the slot) once `cancelled` is set.
+    lock = threading.Lock()
+    next_start = [0.0]
+
+    def wait() -> bool:
+        with lock:
+            now = time.monotonic()
+            start = max(now, next_start[0])
+            next_start[0] = start + interval
+        if start > now:
+            return not cancelled.wait(start - now)
+        return not cancelled.is_set()
+
+    return wait
+
+
+def download_file(session: "requests.Session | httpx.Client", url: str, dest: str, overwrite: bool = False,
+                  throttle: Optional[Callable[[], bool]] = None, existing: Optional[Set[str]] = None):
+    # `existing` is a pre-scanned set of file names in dest's folder; it saves one stat() per file
+    fname = os.path.basename(dest)
+    if not overwrite:
+        if existing is not None:
+            if fname in existing:
+                return
+        elif os.path.exists(dest):
+            return
+    if throttle is not None and not throttle():
         return
-    with session.get(url, stream=True, timeout=60) as r:
+    if httpx is not None and isinstance(session, httpx.Client):
+        _download_httpx(session, url, dest)
+    else:
+        _download_requests(session, url, dest)
+    if existing is not None:
+        existing.add(fname)
+
+
+def _download_requests(session: requests.Session, url: str, dest: str):
+    with session.get(url, stream=True, timeout=60, headers=IMAGE_HEADERS) as r:
+        r.raise_for_status()
+        # Card images are ~1 MB: read them in one go; only stream unusually large bodies
+        if int(r.headers.get("Content-Length") or 0) > STREAM_THRESHOLD:
+            r.raw.decode_content = True
+            with open(dest, "wb") as f:
+                shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+        else:
+            buf = r.content
+            with open(dest, "wb") as f:
+                f.write(buf)
+
+
+def _download_httpx(client: "httpx.Client", url: str, dest: str):
+    with client.stream("GET", url, timeout=60, headers=IMAGE_HEADERS) as r:
         r.raise_for_status()
-        with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
+        if int(r.headers.get("Content-Length") or 0) > STREAM_THRESHOLD:
+            with open(dest, "wb") as f:
+                for chunk in r.iter_bytes(1024 * 1024):
                     f.write(chunk)
-    if delay > 0:
-        time.sleep(delay)
+        else:
+            buf = r.read()
+            with open(dest, "wb") as f:
+                f.write(buf)
 
 
 def make_filename(card: Dict, qty: int, face_suffix: str) -> str:
@@ -206,24 +377,84 @@ def make_filename(card: Dict, qty: int, face_suffix: str) -> str:
 
 
 def infer_extension_from_url(url: str) -> str:
-    m = re.search(r"\.(png|jpg|jpeg)(?:\?|$)", url, flags=re.IGNORECASE)
-    if m:
-        return "." + m.group(1).lower()
-    return ".img"
-
-
-def group_by_identifier(entries: List[Dict]) -> Dict[str, List[Dict]]:
-    def key(e):
-        if e.get("set") and e.get("collector_number"):
-            return f"set:{e['set']}#cn:{e['collector_number']}"
-        elif e.get("set"):
-            return f"name:{e['name'].lower()}#set:{e['set']}"
-        else:
-            return f"name:{e['name'].lower()}"
-    groups = {}
-    for e in entries:
-        groups.setdefault(key(e), []).append(e)
-    return groups
+    q = url.find("?")
+    end = q if q != -1 else len(url)
+    dot = url.rfind(".", 0, end)
+    if dot == -1:
+        return ".img"
+    ext = url[dot:end].lower()
+    return ext if ext in IMAGE_EXTENSIONS else ".img"
+
+
+def image_files(card: Dict, qty: int, size: str) -> List[Tuple[str, str]]:
+    files = []
+    for url, suffix in pick_image_uris(card, size=size):
+        base = make_filename(card, qty=qty, face_suffix=suffix)
+        ext = infer_extension_from_url(url)
+        files.append((url, f"{base}{ext}"))
+    return files
+
+
+def is_downloaded(card: Dict, qty: int, size: str, existing: Set[str]) -> bool:
+    try:
+        return all(fname in existing for _url, fname in image_files(card, qty, size))
+    except KeyError:
+        return False
+
+
+def json_loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode("utf-8")
+
+
+def identifier_cache_key(ident: Dict) -> str:
+    return hashlib.sha1(json.dumps(ident, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def default_cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, CACHE_DIRNAME, CACHE_FILENAME)
+
+
+def load_card_cache(path: str) -> Dict[str, Dict]:
+    try:
+        with open(path, "rb") as f:
+            cache = json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_card_cache(path: str, new_cards: Dict[str, Dict]):
+    # Merge with whatever is on disk now (another run may have written meanwhile),
+    # then swap the file in atomically so readers never see a partial write
+    cache_dir = os.path.dirname(path)
+    ensure_dir(cache_dir)
+    cache = load_card_cache(path)
+    cache.update(new_cards)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".cards-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps(cache))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def identifier_key(e: Dict) -> Tuple:
+    # Tuple keys hash as cheaply as strings and skip per-entry string formatting
+    set_code = e.get("set")
+    cn = e.get("collector_number")
+    if set_code and cn:
+        return ("sc", set_code, cn)
+    elif set_code:
+        return ("ns", e["name"].lower(), set_code)
+    else:
+        return ("n", e["name"].lower())
 
 
 def main():
@@ -232,11 +463,18 @@ def main():
     parser.add_argument("--out", "-o", type=str, default=None, help="Output directory. If omitted and --input is provided, uses the input filename (no extension). Otherwise defaults to ./cards")
     parser.add_argument("--size", "-s", type=str, default="png", choices=sorted(VALID_SIZES), help="Image size (default: png)")
     parser.add_argument("--unique", action="store_true", help="Ignore quantities; one image per unique identifier")
-    parser.add_argument("--overwrite", action="store_true", help="Overwrite existing files")
-    parser.add_argument("--delay", type=float, default=0.0, help="Delay in seconds between file downloads (default: 0)")
+    parser.add_argument("--overwrite", action="store_true", help="Overwrite existing files (implies --refresh-cache)")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached card lookups and re-query Scryfall for every identifier")
+    parser.add_argument("--delay", type=float, default=0.0, help="Minimum delay in seconds between file downloads, across all workers (default: 0)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Concurrent image downloads (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--http2", action="store_true", help="Use HTTP/2 via httpx (pip install 'httpx[http2]'), multiplexing requests over one connection")
     parser.add_argument("--timeout", type=float, default=30.0, help="HTTP timeout in seconds (default: 30)")
     parser.add_argument("--debug", action="store_true", help="Verbose debug logs to stderr")
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.http2 and httpx is None:
+        parser.error("--http2 requires httpx: pip install 'httpx[http2]'")
 
     # Decide output directory based on input file name if --out not supplied
     if args.out is None:
@@ -254,69 +492,146 @@ def main():
     else:
         lines = read_decklist_from_stdin()
 
-    # Parse
-    parsed = []
+    # Parse and merge duplicate identifiers in a single pass
+    agg: Dict[Tuple, Dict] = {}
+    total_lines = 0
     for line in lines:
         e = parse_deck_line(line)
-        if e:
-            parsed.append(e)
+        if not e:
+            continue
+        total_lines += 1
+        k = identifier_key(e)
+        if k in agg:
+            agg[k]["qty"] += e["qty"]
+        else:
+            agg[k] = e
 
-    if not parsed:
+    if not agg:
         print("No cards parsed from input. If you pasted on Windows, be sure to press Ctrl-Z then Enter. "
               "Or run with --input deckname.txt", file=sys.stderr)
         sys.exit(1)
 
-    grouped = group_by_identifier(parsed)
-    aggregated: List[Dict] = []
-    for _k, items in grouped.items():
-        total_qty = sum(i["qty"] for i in items)
-        exemplar = items[0].copy()
-        exemplar["qty"] = 1 if args.unique else total_qty
-        aggregated.append(exemplar)
+    aggregated: List[Dict] = list(agg.values())
+    if args.unique:
+        for e in aggregated:
+            e["qty"] = 1
 
-    identifiers = build_identifiers(aggregated)
     print(f"Output folder: {out_dir}", file=sys.stderr)
-    print(f"Found {len(aggregated)} unique identifiers from {len(parsed)} lines.", file=sys.stderr)
+    print(f"Found {len(aggregated)} unique identifiers from {total_lines} lines.", file=sys.stderr)
+
+    # Resolve what we can from the local card cache; only unknown identifiers hit the API
+    ensure_dir(out_dir)
+    cache_path = default_cache_path()
+    # --refresh-cache (implied by --overwrite) re-resolves every identifier; results still refresh the cache
+    refresh = args.refresh_cache or args.overwrite
+    card_cache = {} if refresh else load_card_cache(cache_path)
+    new_cards: Dict[str, Dict] = {}
+    existing: Set[str] = set()
+    if not args.overwrite:
+        with os.scandir(out_dir) as it:
+            existing = {de.name for de in it}
+    resolved_cards: List[Tuple[Dict, int]] = []
+    pending: List[Tuple[Dict, Dict]] = []
+    skipped = 0
+    for ident, entry in zip(build_identifiers(aggregated), aggregated):
+        cached = card_cache.get(identifier_cache_key(ident))
+        if cached is None:
+            pending.append((ident, entry))
+        elif is_downloaded(cached, entry["qty"], args.size, existing):
+            dprint(args.debug, "Already downloaded:", ident)
+            skipped += 1
+        else:
+            resolved_cards.append((cached, entry["qty"]))
+    if skipped:
+        print(f"Skipping {skipped} already downloaded.", file=sys.stderr)
+    dprint(args.debug, f"{len(aggregated) - len(pending)} identifiers resolved from cache {cache_path}")
 
     # HTTP session
-    session = requests.Session()
-    session.headers.update({"User-Agent": "scryfall-downloader/1.2 (+https://scryfall.com/docs/api)"})
+    if args.http2:
+        try:
+            session = make_http2_client(max_connections=max(16, args.workers), timeout=args.timeout)
+        except ImportError as ex:  # httpx without the h2 extra
+            parser.error(f"--http2 needs the HTTP/2 extra: pip install 'httpx[http2]' ({ex})")
+    else:
+        session = make_session(pool_maxsize=max(32, args.workers))
     timeout = args.timeout
 
-    # Resolve cards in batches
-    resolved_cards: List[Tuple[Dict, int]] = []
+    # Resolve remaining cards in batches
     missing: List[Dict] = []
 
-    for start in range(0, len(identifiers), BATCH_SIZE):
-        batch_ids = identifiers[start:start+BATCH_SIZE]
+    for batch in chunked(pending, BATCH_SIZE):
+        batch_ids = [ident for ident, _entry in batch]
         payload = {"identifiers": batch_ids}
-        resp = session.post(SCRYFALL_COLLECTION_URL, json=payload, timeout=timeout)
-        resp.raise_for_status()
-        data = resp.json()
+        resp = post_collection(session, payload, timeout)
+        data = json_loads(resp.content)
         returned = data.get("data", [])
-        for nf in data.get("not_found", []):
-            missing.append(nf)
-        for card_json, entry in zip(returned, aggregated[start:start+BATCH_SIZE]):
+        not_found = data.get("not_found", [])
+        missing.extend(not_found)
+        # "data" keeps request order but omits not_found identifiers, which are echoed back as sent
+        nf_keys = {tuple(sorted(nf.items())) for nf in not_found}
+        found = [(ident, entry) for ident, entry in batch if tuple(sorted(ident.items())) not in nf_keys]
+        aligned = len(found) == len(returned)
+        if not aligned:
+            print(f"Warning: Scryfall returned {len(returned)} cards for {len(found)} found identifiers; "
+                  "quantities in this batch may be misattributed.", file=sys.stderr)
+        for card_json, (ident, entry) in zip(returned, found):
             resolved_cards.append((card_json, entry["qty"]))
+            if aligned:
+                new_cards[identifier_cache_key(ident)] = card_json
 
-    # Download
-    ensure_dir(out_dir)
+    # Plan downloads: one job per image file (double-faced cards yield one per face)
     errors = []
-    pbar = tqdm(total=len(resolved_cards), desc="Downloading", unit="card")
+    jobs: List[Tuple[str, str, str]] = []
     for card_json, qty in resolved_cards:
+        name = card_json.get("name", "Unknown")
         try:
-            pairs = pick_image_uris(card_json, size=args.size)
-            for url, suffix in pairs:
-                base = make_filename(card_json, qty=qty, face_suffix=suffix)
-                ext = infer_extension_from_url(url)
-                dest_path = os.path.join(out_dir, f"{base}{ext}")
-                download_file(session, url, dest_path, overwrite=args.overwrite, delay=args.delay)
+            files = image_files(card_json, qty, args.size)
         except Exception as ex:
-            name = card_json.get("name", "Unknown")
             errors.append((name, str(ex)))
-        finally:
-            pbar.update(1)
+            continue
+        for url, fname in files:
+            jobs.append((name, url, os.path.join(out_dir, fname)))
+
+    # Download; files are independent and the work is I/O-bound, so fetch several at once
+    pbar = tqdm(total=len(jobs), desc="Downloading", unit="file")
+    cancelled = threading.Event()
+    throttle = make_throttle(args.delay, cancelled) if args.delay > 0 else None
+    # Not a `with` block: its exit waits for every queued job, which would make Ctrl-C hang
+    executor = ThreadPoolExecutor(max_workers=args.workers)
+    futures = {
+        executor.submit(download_file, session, url, dest, args.overwrite, throttle, existing): name
+        for name, url, dest in jobs
+    }
+    # Completions are drained on this thread only; refresh the bar in batches, not per file
+    done = 0
+    try:
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as ex:
+                errors.append((futures[future], str(ex)))
+            finally:
+                done += 1
+                if done % PROGRESS_BATCH == 0:
+                    pbar.update(PROGRESS_BATCH)
+    except KeyboardInterrupt:
+        # Drop queued downloads and wake throttled workers; only in-flight transfers finish
+        cancelled.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+        pbar.close()
+        raise
+    executor.shutdown()
+    pbar.update(done % PROGRESS_BATCH)
     pbar.close()
+    session.close()
+
+    if new_cards:
+        try:
+            save_card_cache(cache_path, new_cards)
+        except OSError as ex:
+            print(f"Could not update card cache {cache_path}: {ex}", file=sys.stderr)
 
     if missing:
         print("\nNot found (check spelling/printing):", file=sys.stderr)